@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Shared YAML Loader
+Parses YAML files once per version on disk for all scripts in this directory,
+and writes them back atomically
+"""
+
+import os
+import stat
+import tempfile
+import yaml
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Tuple
+
+# Use the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+# Most parsed files kept at once; the least recently used is dropped first
+_MAX_ENTRIES = 16
+
+# Parsed data by path, with the (mtime_ns, size) it was parsed at
+_CACHE: 'OrderedDict[Path, Tuple[Tuple[int, int], Any]]' = OrderedDict()
+
+
+def parse_yaml(path: Path) -> Any:
+    """Parse a YAML file without going through the cache"""
+    # The loader decodes the raw bytes itself, with no text-mode wrapper
+    return yaml.load(Path(path).read_bytes(), Loader=_Loader)
+
+
+def load_yaml(path, parse: Callable[[Path], Any] = parse_yaml) -> Any:
+    """Parse a YAML file, reusing the previous result while it is unchanged on disk
+    
+    parse(path) is called on a miss, so callers can read the data from a
+    faster copy of the file. The returned object is shared between callers;
+    call forget(path) before mutating it.
+    """
+    path = Path(path)
+    st = path.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    hit = _CACHE.get(path)
+    if hit is not None and hit[0] == key:
+        _CACHE.move_to_end(path)
+        return hit[1]
+    
+    data = parse(path)
+    _CACHE[path] = (key, data)
+    _CACHE.move_to_end(path)
+    if len(_CACHE) > _MAX_ENTRIES:
+        _CACHE.popitem(last=False)
+    return data
+
+
+def forget(path) -> None:
+    """Drop the cached parse of a file"""
+    _CACHE.pop(Path(path), None)
+
+
+# Writes keep the pure-Python emitter: libyaml escapes emoji outside the BMP,
+# which would rewrite existing descriptions in resources.yml.
+def write_yaml_atomic(path, data: Any) -> None:
+    """Dump YAML to a temporary file next to path, then swap it into place.
+    
+    Readers (and concurrent runs) see either the old or the new file, never a
+    partially written one.
+    """
+    path = Path(path)
+    tmp = tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=path.parent,
+                                      prefix=f'.{path.name}.', suffix='.tmp',
+                                      delete=False)
+    try:
+        with tmp:
+            yaml.dump(data, tmp, default_flow_style=False, allow_unicode=True, 
+                     sort_keys=False, indent=2)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        # Keep the original permissions (temporary files are created 0600)
+        if path.exists():
+            os.chmod(tmp.name, stat.S_IMODE(path.stat().st_mode))
+        os.replace(tmp.name, path)
+    except Exception:
+        if os.path.exists(tmp.name):
+            os.unlink(tmp.name)
+        raise
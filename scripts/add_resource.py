@@ -4,36 +4,162 @@ AI Resources Add Tool
 Interactive CLI for adding new resources to the collection
 """
 
-import yaml
 import sys
 import re
+import bisect
+import functools
 import requests
 from pathlib import Path
+from collections import defaultdict
 from typing import Dict, List, Set, Optional, Tuple
 from urllib.parse import urlparse
 from url_index import URLIndex
+from _yaml_cache import load_yaml, forget, write_yaml_atomic
+
+# Tag format check (category/subcategory/item), compiled once per module
+_TAG_RE = re.compile(r'^[A-Za-z0-9\-]+(?:/[A-Za-z0-9\-]+)*')
+
+# URL format check: http(s) scheme, dotted host name, optional port/path/query
+_URL_RE = re.compile(
+    r'^(?:https?://)?(?:[A-Za-z0-9][A-Za-z0-9\-]{0,62}\.)+[A-Za-z]{2,63}(?:[/:?#].*)?\Z',
+    re.IGNORECASE
+)
+
+
+# Line patterns for block-style 'tags:' lists as written by yaml.dump
+_TAGS_KEY_RE = re.compile(r'^(\s*(?:-\s+)?)tags:\s*(\S.*)?$')
+_LIST_ITEM_RE = re.compile(r'^(\s*)-\s+(.+)$')
+
+
+def _scan_yaml_tags(lines) -> Optional[Set[str]]:
+    """Collect tag values from resources.yml lines without a full YAML parse.
+    
+    Only plain block-style lists are understood. Returns None when any other
+    form of 'tags:' value (flow lists, quoted or commented items) shows up,
+    or when a line inside a tags list is not clearly an item or the next key
+    (blank, comment or continuation lines), so the caller can fall back to
+    yaml.load.
+    """
+    tags = set()
+    tags_indent = None  # indentation of the 'tags:' key while inside its list
+    
+    for line in lines:
+        line = line.rstrip('\r\n')
+        if tags_indent is not None:
+            item = _LIST_ITEM_RE.match(line)
+            if item and len(item.group(1)) >= tags_indent:
+                value = item.group(2).rstrip()
+                if value[0] in '\'"[{&*!|>' or ' #' in value or ':' in value:
+                    return None
+                tags.add(value)
+                continue
+            # Only a key or item at most as indented as 'tags:' ends the list
+            stripped = line.lstrip()
+            if (not stripped or stripped[0] == '#' or
+                    len(line) - len(stripped) > tags_indent):
+                return None
+            tags_indent = None
+        
+        key = _TAGS_KEY_RE.match(line)
+        if key:
+            rest = key.group(2)
+            if rest is None:
+                tags_indent = len(key.group(1))
+            elif rest.rstrip() != '[]':
+                return None
+    
+    return tags
+
+
+# Tags listed per category in the tag display; the rest are reachable via search
+_TAGS_PER_CATEGORY = 50
+
+# Name suggestion: domains whose path names the resource, and path parts to skip
+_ACADEMIC_SUFFIXES = ('.edu', '.ac.uk', '.org')
+_SKIP_PATH_TOKENS = frozenset({'www', 'index', 'html', 'php'})
+
+
+@functools.lru_cache(maxsize=1024)
+def _suggest_name_from_url(url: str) -> Optional[str]:
+    """Try to suggest a name based on the URL"""
+    try:
+        parsed = urlparse(url)
+        domain = parsed.netloc.lower()
+        path = parsed.path.strip('/')
+        
+        # GitHub repositories
+        if 'github.com' in domain:
+            parts = path.split('/')
+            if len(parts) >= 2:
+                return parts[1].replace('-', ' ').replace('_', ' ').title()
+        
+        # ArXiv papers
+        if 'arxiv.org' in domain:
+            return "Research Paper"
+        
+        # Common academic domains
+        if domain.endswith(_ACADEMIC_SUFFIXES):
+            if path:
+                # Extract the first meaningful part from the path
+                part = next((p for p in path.split('/')
+                             if len(p) > 3 and p.lower() not in _SKIP_PATH_TOKENS), None)
+                if part:
+                    return part.replace('-', ' ').replace('_', ' ').title()
+        
+        # Default to domain name
+        domain_name = domain.split('.')[0] if '.' in domain else domain
+        return domain_name.replace('-', ' ').replace('_', ' ').title()
+        
+    except Exception:
+        return None
 
 
 class ResourceAdder:
     """Interactive tool for adding resources"""
     
-    def __init__(self, resources_file: Path = None):
+    def __init__(self, resources_file: Path = None, prefilled_url: Optional[str] = None):
         self.script_dir = Path(__file__).parent
         self.resources_file = resources_file or self.script_dir.parent / 'resources.yml'
-        self.url_index = URLIndex()
-        self.existing_tags = self._load_existing_tags()
-        
+        self._prefilled_url: Optional[str] = prefilled_url
+        # Reused across URL checks so repeated requests keep the connection alive
+        self._session = requests.Session()
+        # Parsed resources.yml, kept across adds so it is only read once
+        self._data_cache: Optional[Dict] = None
+        
+    @functools.cached_property
+    def url_index(self) -> URLIndex:
+        """URL index, loaded on first use"""
+        return URLIndex()
+    
+    @functools.cached_property
+    def existing_tags(self) -> Set[str]:
+        """Tags already in the collection, loaded on first use"""
+        return self._load_existing_tags()
+    
+    @functools.cached_property
+    def _tags_by_cat(self) -> Dict[str, List[str]]:
+        """Tags grouped by category (first path part), each group kept sorted"""
+        tags_by_cat: Dict[str, List[str]] = defaultdict(list)
+        for tag in sorted(self.existing_tags):
+            tags_by_cat[tag.split('/', 1)[0]].append(tag)
+        return tags_by_cat
+    
     def _load_existing_tags(self) -> Set[str]:
-        """Load all existing tags from the URL index and resources file"""
-        tags = set()
-        
-        # Get tags from URL index
-        tags.update(self.url_index.get_all_tags())
-        
-        # Also load from resources file as backup
+        """Load all existing tags from the URL index, or the resources file as backup"""
+        # The URL index is rebuilt from resources.yml, so its tags are enough
+        tags = set(self.url_index.get_all_tags())
+        if tags:
+            return tags
+        
+        # Fall back to the resources file when the index is empty or missing.
+        # A line scan is enough for the tag lists; parse fully only if needed.
         try:
             with open(self.resources_file, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+                scanned = _scan_yaml_tags(f)
+            if scanned is not None:
+                return scanned
+            
+            data = load_yaml(self.resources_file)
             
             for resource in data.get('resources', []):
                 tags.update(resource.get('tags', []))
@@ -49,33 +175,20 @@ class ResourceAdder:
             return False, "URL cannot be empty"
         
         # Clean up the URL
-        original_url = url.strip()
-        
-        # Handle various URL formats users might enter
-        url = original_url.lower().strip()
+        test_url = url.strip()
         
-        # Remove common prefixes for normalization, but keep original for validation
-        test_url = original_url
-        if not test_url.startswith(('http://', 'https://')):
+        # Add a scheme if missing (compare prefixes without lowercasing the URL)
+        if not (test_url[:7].lower() == 'http://' or test_url[:8].lower() == 'https://'):
             # Try with https first
             test_url = 'https://' + test_url
         
-        # Basic URL format validation
-        try:
-            parsed = urlparse(test_url)
-            if not parsed.netloc:
-                return False, "Invalid URL format"
-            
-            # Ensure the netloc looks reasonable
-            if '.' not in parsed.netloc:
-                return False, "Invalid domain format"
-                
-        except Exception:
+        # Basic URL format validation (scheme, dotted domain, rest of the URL)
+        if not _URL_RE.match(test_url):
             return False, "Invalid URL format"
         
         # Check if URL is accessible (optional, can be skipped for speed)
         try:
-            response = requests.head(test_url, timeout=10, allow_redirects=True)
+            response = self._session.head(test_url, timeout=10, allow_redirects=True)
             if response.status_code >= 400:
                 print(f"⚠️  Warning: URL returned status {response.status_code}")
             elif response.url != test_url:
@@ -85,25 +198,20 @@ class ResourceAdder:
         
         return True, test_url
     
-    def _format_tags_display(self, tags: List[str]) -> str:
-        """Format tags for display with colors and organization"""
-        if not tags:
+    def _format_tags_display(self) -> str:
+        """Format existing tags for display with colors and organization"""
+        if not self._tags_by_cat:
             return "No tags"
         
-        # Group tags by category
-        categories = {}
-        for tag in sorted(tags):
-            parts = tag.split('/')
-            category = parts[0] if parts else 'misc'
-            if category not in categories:
-                categories[category] = []
-            categories[category].append(tag)
-        
+        # Tags are already grouped and sorted; only the categories need ordering
         output = []
-        for category, cat_tags in sorted(categories.items()):
+        for category in sorted(self._tags_by_cat):
+            cat_tags = self._tags_by_cat[category]
             output.append(f"\n📁 {category.upper()}:")
-            for i, tag in enumerate(cat_tags, 1):
+            for i, tag in enumerate(cat_tags[:_TAGS_PER_CATEGORY], 1):
                 output.append(f"   {i:2d}. {tag}")
+            if len(cat_tags) > _TAGS_PER_CATEGORY:
+                output.append(f"   ... ({len(cat_tags) - _TAGS_PER_CATEGORY} more, use search)")
         
         return ''.join(output)
     
@@ -115,7 +223,10 @@ class ResourceAdder:
         print("🏷️  TAG SELECTION")
         print("="*60)
         print("Available tags:")
-        print(self._format_tags_display(list(self.existing_tags)))
+        print(self._format_tags_display())
+        
+        # Lowercase each tag once for searching instead of on every search
+        existing_lower = {tag: tag.lower() for tag in self.existing_tags}
         
         while True:
             print(f"\nCurrently selected: {selected_tags}")
@@ -132,7 +243,7 @@ class ResourceAdder:
                 break
             elif choice == '5' or choice.lower().startswith('search'):
                 search_term = input("Enter search term: ").lower()
-                matching_tags = [tag for tag in self.existing_tags if search_term in tag.lower()]
+                matching_tags = [tag for tag, tag_lower in existing_lower.items() if search_term in tag_lower]
                 if matching_tags:
                     print(f"\nFound {len(matching_tags)} matching tags:")
                     for i, tag in enumerate(matching_tags, 1):
@@ -157,7 +268,7 @@ class ResourceAdder:
                 continue
             
             # Validate tag format (should be like category/subcategory/item)
-            if not re.match(r'^[A-Za-z0-9\-]+(/[A-Za-z0-9\-]+)*', tag_name):
+            if not _TAG_RE.match(tag_name):
                 print("❌ Invalid tag format. Use lowercase letters, numbers, hyphens, and forward slashes.")
                 print("   Examples: tools/development, libraries/python/ml, datasets/images")
                 continue
@@ -172,6 +283,8 @@ class ResourceAdder:
             if tag_name not in self.existing_tags:
                 print(f"✨ Created new tag: {tag_name}")
                 self.existing_tags.add(tag_name)
+                existing_lower[tag_name] = tag_name.lower()
+                bisect.insort(self._tags_by_cat[tag_name.split('/', 1)[0]], tag_name)
             else:
                 print(f"✅ Added existing tag: {tag_name}")
         
@@ -217,44 +330,19 @@ class ResourceAdder:
     
     def _suggest_name_from_url(self, url: str) -> Optional[str]:
         """Try to suggest a name based on the URL"""
-        try:
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
-            path = parsed.path.strip('/')
-            
-            # GitHub repositories
-            if 'github.com' in domain:
-                parts = path.split('/')
-                if len(parts) >= 2:
-                    return parts[1].replace('-', ' ').replace('_', ' ').title()
-            
-            # ArXiv papers
-            if 'arxiv.org' in domain:
-                return "Research Paper"
-            
-            # Common academic domains
-            if any(domain.endswith(suffix) for suffix in ['.edu', '.ac.uk', '.org']):
-                if path:
-                    # Extract meaningful part from path
-                    path_parts = path.split('/')
-                    for part in path_parts:
-                        if len(part) > 3 and part.lower() not in ['www', 'index', 'html', 'php']:
-                            return part.replace('-', ' ').replace('_', ' ').title()
-            
-            # Default to domain name
-            domain_name = domain.split('.')[0] if '.' in domain else domain
-            return domain_name.replace('-', ' ').replace('_', ' ').title()
-            
-        except Exception:
-            return None
+        return _suggest_name_from_url(url)
     
     def add_resource_interactive(self) -> bool:
         """Main interactive flow for adding a resource"""
         print("\n🤖 AI Resources Add Tool")
         print("="*60)
         
-        # Get URL
-        url = input("Enter resource URL: ").strip()
+        # Get URL (skip the prompt when one was given on the command line)
+        if self._prefilled_url:
+            url = self._prefilled_url.strip()
+            print(f"Enter resource URL: {url}")
+        else:
+            url = input("Enter resource URL: ").strip()
         is_valid, validated_url = self._validate_url(url)
         
         if not is_valid:
@@ -303,17 +391,22 @@ class ResourceAdder:
     def _add_to_resources_file(self, resource_info: Dict) -> bool:
         """Add resource to the YAML file"""
         try:
-            # Load existing resources
-            with open(self.resources_file, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+            # Load existing resources once per session; later adds reuse them.
+            # The dict is mutated from here on, so take it out of the cache.
+            if self._data_cache is None:
+                self._data_cache = load_yaml(self.resources_file)
+                forget(self.resources_file)
+            data = self._data_cache
             
-            resources = data.get('resources', [])
+            resources = data.setdefault('resources', [])
             resources.append(resource_info)
             
-            # Save updated resources
-            with open(self.resources_file, 'w', encoding='utf-8') as f:
-                yaml.dump(data, f, default_flow_style=False, allow_unicode=True, 
-                         sort_keys=False, indent=2)
+            # Save updated resources; on failure keep the cache as it is on disk
+            try:
+                write_yaml_atomic(self.resources_file, data)
+            except Exception:
+                resources.pop()
+                raise
             
             # Update URL index
             self.url_index.add_url(
@@ -357,25 +450,13 @@ Examples:
     args = parser.parse_args()
     
     try:
-        adder = ResourceAdder(args.resources_file)
-        
         if args.batch:
             from batch_import import BatchImporter
             importer = BatchImporter(args.resources_file)
             success = importer.import_batch(args.batch, interactive=True)
             sys.exit(0 if success else 1)
         
-        # Pre-fill URL if provided
-        if args.url:
-            # Monkey patch the input for URL
-            original_input = input
-            def mock_input(prompt):
-                if "resource URL" in prompt:
-                    print(f"{prompt}{args.url}")
-                    return args.url
-                return original_input(prompt)
-            __builtins__['input'] = mock_input
-        
+        adder = ResourceAdder(args.resources_file, prefilled_url=args.url)
         success = adder.add_resource_interactive()
         sys.exit(0 if success else 1)
         
@@ -6,10 +6,53 @@ Batch import resources from YAML files with duplicate checking
 
 import yaml
 import sys
+import re
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, List, Set, Optional, Tuple
 from url_index import URLIndex
+from _yaml_cache import write_yaml_atomic
+
+# requests is only needed for --check-urls
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:
+    requests = None
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+# Tag format check (category/subcategory/item), compiled once per module
+_TAG_RE = re.compile(r'^[A-Za-z0-9\-]+(?:/[A-Za-z0-9\-]+)*')
+
+# Fields every batch resource must provide (non-empty)
+_REQUIRED_FIELDS = ('name', 'url', 'description', 'tags')
+
+# Marks a missing field, or a URL that has not been looked up yet
+# (a cached None means "not a duplicate")
+_MISSING = object()
+
+# Concurrent HEAD requests used when checking URL accessibility
+_PROBE_WORKERS = 16
+
+# End of resources.yml read to check its layout before appending
+_TAIL_BYTES = 64 * 1024
+
+
+def _ends_in_dump_layout(text: str) -> bool:
+    """Whether the last top-level list item in text starts at column 0 and
+    nothing after it does, as in yaml.dump output"""
+    last_item = max(text.rfind('\n- '), text.rfind('\n-\n'))
+    if last_item < 0:
+        return False
+    tail = text[last_item + 1:].split('\n')[1:]
+    return all(not line or line[0] == ' ' for line in tail)
 
 
 class BatchImporter:
@@ -18,7 +61,6 @@ class BatchImporter:
     def __init__(self, resources_file: Path = None):
         self.script_dir = Path(__file__).parent
         self.resources_file = resources_file or self.script_dir.parent / 'resources.yml'
-        self.url_index = URLIndex()
         self.stats = {
             'total': 0,
             'added': 0,
@@ -26,16 +68,40 @@ class BatchImporter:
             'errors': 0,
             'duplicates': []
         }
-        
+        # Duplicate lookups already answered by the URL index, keyed by URL
+        self._dup_cache: Dict[str, Optional[Dict]] = {}
+        self._session = None
+        # Per-resource progress lines, written to stdout in chunks
+        self._out_buf: List[str] = []
+        self._flush_every = 256
+        
+    @cached_property
+    def url_index(self) -> URLIndex:
+        """URL index, loaded on first use"""
+        return URLIndex()
+    
+    def _log(self, msg: str):
+        """Queue a progress line, writing the queue out every _flush_every lines"""
+        self._out_buf.append(msg)
+        if len(self._out_buf) >= self._flush_every:
+            self._flush_log()
+    
+    def _flush_log(self):
+        """Write out any queued progress lines"""
+        if self._out_buf:
+            sys.stdout.write('\n'.join(self._out_buf) + '\n')
+            sys.stdout.flush()
+            self._out_buf.clear()
+    
     def _validate_resource(self, resource: Dict, index: int) -> Tuple[bool, str]:
         """Validate a single resource entry"""
         
-        # Check required fields
-        required_fields = ['name', 'url', 'description', 'tags']
-        for field in required_fields:
-            if field not in resource:
+        # Check required fields in order, one dict lookup per field
+        for field in _REQUIRED_FIELDS:
+            value = resource.get(field, _MISSING)
+            if value is _MISSING:
                 return False, f"Missing required field: {field}"
-            if not resource[field]:
+            if not value:
                 return False, f"Empty field: {field}"
         
         # Validate URL format
@@ -55,25 +121,60 @@ class BatchImporter:
             if not tag.strip():
                 return False, "Empty tag found"
             # Check tag format (lowercase, hyphens, slashes)
-            import re
-            if not re.match(r'^[A-Za-z0-9\-]+(/[A-Za-z0-9\-]+)*', tag):
+            if not _TAG_RE.match(tag):
                 return False, f"Invalid tag format: {tag}"
         
         return True, "Valid"
     
     def _check_duplicate(self, url: str) -> Optional[Dict]:
         """Check if URL is a duplicate"""
-        return self.url_index.check_duplicate(url)
+        hit = self._dup_cache.get(url, _MISSING)
+        if hit is not _MISSING:
+            return hit
+        
+        existing = self.url_index.check_duplicate(url)
+        self._dup_cache[url] = existing
+        return existing
+    
+    def _get_session(self):
+        """Create the keep-alive HTTP session used for URL checks on first use"""
+        if self._session is None:
+            adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+            self._session = requests.Session()
+            self._session.mount('http://', adapter)
+            self._session.mount('https://', adapter)
+        return self._session
+    
+    def _probe(self, url: str) -> Tuple[str, bool, str]:
+        """Send a HEAD request to a URL. Returns (url, ok, status or error)"""
+        try:
+            response = self._get_session().head(url, timeout=10, allow_redirects=True)
+            return url, response.status_code < 400, f"status {response.status_code}"
+        except requests.RequestException as e:
+            return url, False, str(e)
+    
+    def _probe_urls(self, resources_list: List[Dict]) -> Dict[str, Tuple[bool, str]]:
+        """Check accessibility of all http(s) URLs in the batch concurrently"""
+        urls = {
+            resource['url'].strip() for resource in resources_list
+            if isinstance(resource, dict) and isinstance(resource.get('url'), str)
+            and resource['url'].strip().startswith(('http://', 'https://'))
+        }
+        
+        print(f"🌐 Checking {len(urls)} URLs...")
+        with ThreadPoolExecutor(max_workers=_PROBE_WORKERS) as executor:
+            return {url: (ok, detail) for url, ok, detail in executor.map(self._probe, urls)}
     
     def _process_batch_file(self, batch_file: Path, skip_duplicates: bool = True, 
-                           interactive: bool = False) -> Tuple[List[Dict], List[str]]:
+                           interactive: bool = False,
+                           check_urls: bool = False) -> Tuple[List[Dict], List[str]]:
         """Process a batch YAML file and return valid resources and errors"""
         
         print(f"\n📁 Processing batch file: {batch_file}")
         
         try:
             with open(batch_file, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=_Loader)
         except Exception as e:
             return [], [f"Failed to load YAML file: {e}"]
         
@@ -95,24 +196,41 @@ class BatchImporter:
         valid_resources = []
         errors = []
         
-        print(f"📊 Found {len(resources_list)} resources to process")
+        total = len(resources_list)
+        print(f"📊 Found {total} resources to process")
+        
+        url_status = self._probe_urls(resources_list) if check_urls else {}
+        
+        # Bind loop-invariant lookups once; this loop runs per batch row
+        validate = self._validate_resource
+        normalize = self.url_index._normalize_url
+        
+        # Resources accepted earlier in this batch, keyed by normalized URL,
+        # so repeats within the file are caught without another index lookup
+        seen_urls: Dict[str, Dict] = {}
         
         for i, resource in enumerate(resources_list, 1):
             self.stats['total'] += 1
             
-            print(f"\n[{i}/{len(resources_list)}] Processing: {resource.get('name', 'Unnamed')}")
+            self._log(f"\n[{i}/{total}] Processing: {resource.get('name', 'Unnamed')}")
             
             # Validate resource structure
-            is_valid, error_msg = self._validate_resource(resource, i)
+            is_valid, error_msg = validate(resource, i)
             if not is_valid:
                 error = f"Resource {i} ({resource.get('name', 'Unnamed')}): {error_msg}"
                 errors.append(error)
-                print(f"❌ {error}")
+                self._log(f"❌ {error}")
                 self.stats['errors'] += 1
                 continue
             
-            # Check for duplicates
-            duplicate = self._check_duplicate(resource['url'])
+            # Report unreachable URLs (like the add tool, this is only a warning)
+            ok, detail = url_status.get(resource['url'].strip(), (True, ''))
+            if not ok:
+                self._log(f"⚠️  Warning: Could not verify URL accessibility ({detail})")
+            
+            # Check for duplicates (earlier rows first, then the URL index)
+            norm_url = normalize(resource['url'])
+            duplicate = seen_urls.get(norm_url) or self._check_duplicate(resource['url'])
             if duplicate:
                 self.stats['skipped_duplicates'] += 1
                 self.stats['duplicates'].append({
@@ -122,29 +240,36 @@ class BatchImporter:
                 })
                 
                 if skip_duplicates:
-                    print(f"⚠️  Skipping duplicate URL: {resource['url']}")
-                    print(f"   Existing: {duplicate['name']}")
+                    self._log(f"⚠️  Skipping duplicate URL: {resource['url']}")
+                    self._log(f"   Existing: {duplicate['name']}")
                     continue
                 
                 # Interactive mode for duplicates
                 if interactive:
-                    print(f"🔍 DUPLICATE DETECTED:")
-                    print(f"   New: {resource['name']} - {resource['url']}")
-                    print(f"   Existing: {duplicate['name']} - {duplicate['original_url']}")
+                    self._log(f"🔍 DUPLICATE DETECTED:")
+                    self._log(f"   New: {resource['name']} - {resource['url']}")
+                    self._log(f"   Existing: {duplicate['name']} - {duplicate['original_url']}")
                     
+                    self._flush_log()
                     choice = input("   Add anyway? (y/N): ").strip().lower()
                     if choice != 'y':
-                        print("   Skipped by user")
+                        self._log("   Skipped by user")
                         continue
                 else:
                     # Non-interactive: skip by default
-                    print(f"⚠️  Skipping duplicate URL: {resource['url']}")
+                    self._log(f"⚠️  Skipping duplicate URL: {resource['url']}")
                     continue
             
             # Resource is valid and not a duplicate (or user chose to add anyway)
             valid_resources.append(resource)
-            print(f"✅ Valid resource: {resource['name']}")
-        
+            seen_urls[norm_url] = {
+                'name': resource['name'],
+                'original_url': resource['url'],
+                'tags': resource['tags']
+            }
+            self._log(f"✅ Valid resource: {resource['name']}")
+        
+        self._flush_log()
         return valid_resources, errors
     
     def _add_resources_to_file(self, resources: List[Dict]) -> bool:
@@ -157,28 +282,39 @@ class BatchImporter:
         try:
             # Load existing resources
             with open(self.resources_file, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=_Loader)
             
             existing_resources = data.get('resources', [])
             
+            # Appending is only safe when 'resources' is the sole top-level key
+            # and already holds a block list for the new items to continue
+            can_append = (list(data) == ['resources'] and
+                          isinstance(existing_resources, list) and
+                          bool(existing_resources))
+            
             # Add new resources
-            for resource in resources:
-                existing_resources.append(resource)
-                
-                # Update URL index
-                self.url_index.add_url(
-                    resource['url'], 
-                    resource['name'], 
-                    resource['tags']
-                )
-                
-                self.stats['added'] += 1
+            existing_resources.extend(resources)
             
             # Save updated resources
-            data['resources'] = existing_resources
-            with open(self.resources_file, 'w', encoding='utf-8') as f:
-                yaml.dump(data, f, default_flow_style=False, allow_unicode=True, 
-                         sort_keys=False, indent=2)
+            if not (can_append and self._append_resources(resources)):
+                data['resources'] = existing_resources
+                write_yaml_atomic(self.resources_file, data)
+            
+            # Only count and cache the new URLs once they are on disk
+            for resource in resources:
+                self._dup_cache[resource['url']] = {
+                    'name': resource['name'],
+                    'original_url': resource['url'],
+                    'tags': resource['tags'],
+                    'added_date': None
+                }
+            self.stats['added'] += len(resources)
+            
+            # Update URL index in one save, only once the resources are written
+            self.url_index.add_urls(
+                (resource['url'], resource['name'], resource['tags'])
+                for resource in resources
+            )
             
             print(f"\n✅ Successfully added {len(resources)} resources")
             print(f"📁 Total resources in collection: {len(existing_resources)}")
@@ -189,6 +325,34 @@ class BatchImporter:
             print(f"❌ Error adding resources to file: {e}")
             return False
     
+    def _append_resources(self, resources: List[Dict]) -> bool:
+        """Append resources to the end of the top-level 'resources:' list
+        
+        Only the new items are written. That is only done when the file's
+        last item is laid out the way yaml.dump writes it, and the dumped
+        items parse back to the same resources. Returns False (leaving the
+        file alone) otherwise.
+        """
+        with open(self.resources_file, 'rb') as f:
+            f.seek(0, 2)
+            f.seek(max(f.tell() - _TAIL_BYTES, 0))
+            tail = f.read().decode('utf-8', errors='replace')
+        if not _ends_in_dump_layout(tail):
+            return False
+        
+        # A top-level list dumps as '- name: ...' blocks, the same layout the
+        # items under 'resources:' already use, so they continue that list
+        text = yaml.dump(resources, default_flow_style=False, allow_unicode=True, 
+                         sort_keys=False, indent=2)
+        if yaml.load(text, Loader=_Loader) != resources:
+            return False
+        
+        with open(self.resources_file, 'a', encoding='utf-8') as f:
+            if not tail.endswith('\n'):
+                f.write('\n')
+            f.write(text)
+        return True
+    
     def _print_summary(self):
         """Print import summary"""
         print("\n" + "="*60)
@@ -208,7 +372,8 @@ class BatchImporter:
             print(f"\n💡 Don't forget to run: python3 generate_readme.py")
     
     def import_batch(self, batch_file: Path, skip_duplicates: bool = True, 
-                    interactive: bool = False, dry_run: bool = False) -> bool:
+                    interactive: bool = False, dry_run: bool = False,
+                    check_urls: bool = False) -> bool:
         """Main batch import function"""
         
         if not batch_file.exists():
@@ -219,9 +384,13 @@ class BatchImporter:
         if dry_run:
             print("🔍 DRY RUN MODE - No changes will be made")
         
+        if check_urls and requests is None:
+            print("❌ --check-urls requires the 'requests' package")
+            return False
+        
         # Process the batch file
         valid_resources, errors = self._process_batch_file(
-            batch_file, skip_duplicates, interactive
+            batch_file, skip_duplicates, interactive, check_urls
         )
         
         # Print errors
@@ -287,6 +456,7 @@ Examples:
     python3 batch_import.py --file batch.yml              # Import with duplicate skip
     python3 batch_import.py --file batch.yml --interactive # Interactive duplicate handling  
     python3 batch_import.py --file batch.yml --dry-run    # Dry run (no changes)
+    python3 batch_import.py --file batch.yml --check-urls # Also check URLs are reachable
     python3 batch_import.py --create-sample sample.yml    # Create sample batch file
 
 YAML file format:
@@ -310,6 +480,8 @@ YAML file format:
                        help='Interactive mode for handling duplicates')
     parser.add_argument('--dry-run', action='store_true',
                        help='Dry run - validate but don\'t add resources')
+    parser.add_argument('--check-urls', action='store_true',
+                       help='Check that URLs are reachable (concurrent HEAD requests)')
     parser.add_argument('--create-sample', type=Path,
                        help='Create a sample batch YAML file')
     
@@ -331,7 +503,8 @@ YAML file format:
             args.file,
             skip_duplicates=args.skip_duplicates,
             interactive=args.interactive,
-            dry_run=args.dry_run
+            dry_run=args.dry_run,
+            check_urls=args.check_urls
         )
         
         sys.exit(0 if success else 1)
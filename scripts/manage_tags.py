@@ -4,12 +4,31 @@ Tag Management Utility
 Manage and analyze tags in the AI Resources collection
 """
 
-import yaml
 import json
+import sys
+import re
+import functools
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Set, Counter
+from typing import Dict, List, Set, Counter, Optional, TextIO, Tuple
 from collections import defaultdict, Counter
-from url_index import URLIndex
+from _yaml_cache import load_yaml, parse_yaml
+
+__all__ = ['TagManager']
+
+# Valid tag format: lowercase path parts separated by single slashes
+_TAG_RE = re.compile(r'^[a-z0-9\-]+(/[a-z0-9\-]+)*$')
+
+# Separators ignored when comparing category names ('-' and '_')
+_STRIP_SEP = str.maketrans('', '', '-_')
+
+
+@functools.lru_cache(maxsize=None)
+def _split_tag(tag: str) -> Tuple[str, str, str]:
+    """First three path parts of a tag; missing parts are ''"""
+    category, _, rest = tag.partition('/')
+    subcategory, _, rest = rest.partition('/')
+    return category, subcategory, rest.partition('/')[0]
 
 
 class TagManager:
@@ -18,84 +37,147 @@ class TagManager:
     def __init__(self, resources_file: Path = None):
         self.script_dir = Path(__file__).parent
         self.resources_file = resources_file or self.script_dir.parent / 'resources.yml'
-        self.url_index = URLIndex()
+        self._url_index = None
+        self._json_cache_file = self.resources_file.with_name(self.resources_file.name + '.jsoncache')
+    
+    @property
+    def url_index(self):
+        """URL index of the collection, loaded on first access"""
+        if self._url_index is None:
+            from url_index import URLIndex
+            self._url_index = URLIndex()
+        return self._url_index
+    
+    def _load_data(self) -> Dict:
+        """Parse resources_file, reusing earlier parses while the file is unchanged
         
-    def analyze_tags(self) -> Dict:
-        """Analyze current tag usage and structure"""
+        Parses are shared through _yaml_cache. A JSON copy of the last one is
+        also kept next to the file (resources.yml.jsoncache), because JSON
+        loads much faster than YAML.
+        """
+        return load_yaml(self.resources_file, parse=self._parse_resources)
+    
+    def _parse_resources(self, path: Path) -> Dict:
+        """Read resources_file from its JSON copy if current, else parse the YAML"""
+        st = path.stat()
+        key = (st.st_mtime_ns, st.st_size)
+        data = self._load_json_cache(key)
+        if data is None:
+            data = parse_yaml(path)
+            self._save_json_cache(key, data)
+        return data
+    
+    def _load_json_cache(self, key: Tuple[int, int]) -> Optional[Dict]:
+        """Return the JSON copy of resources_file if it was made from this version of it"""
         try:
-            with open(self.resources_file, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-        except Exception as e:
-            print(f"Error loading resources: {e}")
-            return {}
+            with open(self._json_cache_file, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        if not isinstance(cached, dict) or cached.get('source') != list(key):
+            return None
+        return cached.get('data')
+    
+    def _save_json_cache(self, key: Tuple[int, int], data: Dict):
+        """Write the JSON copy of resources_file (best effort)"""
+        try:
+            text = json.dumps({'source': list(key), 'data': data}, ensure_ascii=False)
+            with open(self._json_cache_file, 'w', encoding='utf-8') as f:
+                f.write(text)
+        except (OSError, TypeError, ValueError):
+            # Read-only checkout, or values JSON cannot hold (e.g. YAML dates)
+            pass
+    
+    def _collect_counters(self, include_combinations: bool = True) -> Tuple[Counter, Counter, List[str], Counter]:
+        """Count tags, categories and tag combinations in one pass over the resources
         
-        resources = data.get('resources', [])
+        Returns (tag_usage, category_usage, untagged resource names, combinations).
+        """
+        resources = self._load_data().get('resources', [])
         
-        # Collect all tags and their usage
-        tag_usage = Counter()
-        category_usage = Counter()
-        tag_combinations = defaultdict(int)
+        # Split off untagged resources, keeping the tag lists of the others
+        tag_lists = []
         resources_without_tags = []
-        
         for resource in resources:
-            tags = resource.get('tags', [])
-            name = resource.get('name', resource.get('title', 'Unknown'))
-            
-            if not tags:
-                resources_without_tags.append(name)
-                continue
-            
-            # Count individual tags
-            for tag in tags:
-                tag_usage[tag] += 1
-                # Count categories (first part of tag)
-                category = tag.split('/')[0] if '/' in tag else tag
-                category_usage[category] += 1
-            
-            # Count tag combinations
-            if len(tags) > 1:
-                combo = tuple(sorted(tags))
-                tag_combinations[combo] += 1
+            tags = resource.get('tags')
+            if tags:
+                tag_lists.append(tags)
+            else:
+                resources_without_tags.append(resource.get('name', resource.get('title', 'Unknown')))
+        
+        # Counter tallies a flat iterable in C; categories (first part of a
+        # tag) are then summed over the distinct tags only
+        tag_usage = Counter(chain.from_iterable(tag_lists))
+        category_usage = Counter()
+        for tag, count in tag_usage.items():
+            category_usage[_split_tag(tag)[0]] += count
+        
+        # Count tag combinations: identical tag lists are counted together
+        # first, so each distinct list is sorted only once
+        tag_combinations = Counter()
+        if include_combinations:
+            raw_combinations = Counter(tuple(tags) for tags in tag_lists if len(tags) > 1)
+            for tags, count in raw_combinations.items():
+                tag_combinations[tuple(sorted(tags))] += count
+        
+        return tag_usage, category_usage, resources_without_tags, tag_combinations
+    
+    def analyze_tags(self, include_combinations: bool = True) -> Dict:
+        """Analyze current tag usage and structure
+        
+        tag_usage/category_usage are the raw Counters; top_tags/top_categories
+        hold the 15/10 most used as (name, count) pairs. include_combinations=False
+        skips counting tag combinations.
+        """
+        try:
+            tag_usage, category_usage, resources_without_tags, tag_combinations = \
+                self._collect_counters(include_combinations)
+        except Exception as e:
+            print(f"Error loading resources: {e}")
+            return {}
         
         return {
-            'total_resources': len(resources),
+            'total_resources': len(self._load_data().get('resources', [])),
             'total_unique_tags': len(tag_usage),
             'resources_without_tags': len(resources_without_tags),
-            'tag_usage': dict(tag_usage.most_common()),
-            'category_usage': dict(category_usage.most_common()),
-            'common_combinations': dict(sorted(tag_combinations.items(), 
-                                             key=lambda x: x[1], reverse=True)[:10]),
+            'tag_usage': tag_usage,
+            'category_usage': category_usage,
+            # most_common(n) is a heap selection, not a full sort
+            'top_tags': tag_usage.most_common(15),
+            'top_categories': category_usage.most_common(10),
+            'common_combinations': dict(tag_combinations.most_common(10)),
             'untagged_resources': resources_without_tags
         }
     
     def suggest_tag_improvements(self) -> List[str]:
         """Suggest improvements to the tagging system"""
-        analysis = self.analyze_tags()
+        try:
+            tag_usage, category_usage, untagged, _ = self._collect_counters(include_combinations=False)
+        except Exception as e:
+            return [f"Error loading resources: {e}"]
         suggestions = []
         
         # Find singleton tags (used only once)
-        singleton_tags = [tag for tag, count in analysis['tag_usage'].items() if count == 1]
+        singleton_tags = [tag for tag, count in tag_usage.items() if count == 1]
         if singleton_tags:
             suggestions.append(f"Consider consolidating {len(singleton_tags)} tags used only once:")
             for tag in singleton_tags[:10]:  # Show first 10
                 suggestions.append(f"  - {tag}")
         
         # Find resources without tags
-        if analysis['resources_without_tags'] > 0:
-            suggestions.append(f"{analysis['resources_without_tags']} resources have no tags:")
-            for resource in analysis['untagged_resources'][:5]:  # Show first 5
+        if untagged:
+            suggestions.append(f"{len(untagged)} resources have no tags:")
+            for resource in untagged[:5]:  # Show first 5
                 suggestions.append(f"  - {resource}")
         
         # Find inconsistent naming patterns
-        categories = analysis['category_usage'].keys()
-        naming_issues = []
-        for category in categories:
-            # Check for similar categories that might be duplicates
-            for other_category in categories:
-                if (category != other_category and 
-                    category.replace('-', '').replace('_', '') == 
-                    other_category.replace('-', '').replace('_', '')):
-                    naming_issues.append(f"{category} vs {other_category}")
+        # Categories that only differ by '-'/'_' share a normalized key
+        by_normalized = defaultdict(list)
+        for category in category_usage:
+            by_normalized[category.translate(_STRIP_SEP)].append(category)
+        naming_issues = [' vs '.join(sorted(group)) for group in by_normalized.values()
+                         if len(group) > 1]
         
         if naming_issues:
             suggestions.append("Potential naming inconsistencies:")
@@ -107,58 +189,53 @@ class TagManager:
     def get_tag_hierarchy(self) -> Dict:
         """Build hierarchical structure of tags"""
         try:
-            with open(self.resources_file, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+            data = self._load_data()
         except Exception as e:
             print(f"Error loading resources: {e}")
             return {}
         
-        hierarchy = defaultdict(lambda: defaultdict(lambda: defaultdict(set)))
+        # Resource names per (category, subcategory, subitem) path, flat;
+        # lists stay JSON-ready, and seen drops repeated (path, name) pairs
+        flat = defaultdict(list)
+        seen = set()
         
         for resource in data.get('resources', []):
             for tag in resource.get('tags', []):
-                parts = tag.split('/')
-                if len(parts) >= 1:
-                    category = parts[0]
-                    subcategory = parts[1] if len(parts) >= 2 else None
-                    subitem = parts[2] if len(parts) >= 3 else None
-                    
-                    if subcategory:
-                        if subitem:
-                            hierarchy[category][subcategory][subitem].add(resource['name'])
-                        else:
-                            hierarchy[category][subcategory]['_items'].add(resource['name'])
-                    else:
-                        hierarchy[category]['_items']['_items'].add(resource['name'])
+                category, subcategory, subitem = _split_tag(tag)
+                
+                if not subcategory:
+                    subcategory = subitem = '_items'
+                elif not subitem:
+                    subitem = '_items'
+                path = (category, subcategory, subitem)
+                entry = (path, resource['name'])
+                if entry not in seen:
+                    seen.add(entry)
+                    flat[path].append(resource['name'])
         
-        # Convert sets to lists for JSON serialization
-        def convert_sets(obj):
-            if isinstance(obj, dict):
-                return {k: convert_sets(v) for k, v in obj.items()}
-            elif isinstance(obj, set):
-                return list(obj)
-            return obj
+        # Nest the paths in first-seen order
+        hierarchy = {}
+        for (category, subcategory, subitem), names in flat.items():
+            hierarchy.setdefault(category, {}).setdefault(subcategory, {})[subitem] = names
         
-        return convert_sets(dict(hierarchy))
+        return hierarchy
     
     def validate_tag_format(self) -> List[str]:
         """Validate tag formats and find issues"""
         try:
-            with open(self.resources_file, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+            data = self._load_data()
         except Exception as e:
             return [f"Error loading resources: {e}"]
         
         issues = []
-        valid_pattern = r'^[a-z0-9\-]+(/[a-z0-9\-]+)*$'
         
         for resource in data.get('resources', []):
             name = resource.get('name', resource.get('title', 'Unknown'))
             for tag in resource.get('tags', []):
-                # Check format
-                import re
-                if not re.match(valid_pattern, tag):
-                    issues.append(f"Invalid tag format in '{name}': {tag}")
+                # Check format; a valid tag cannot have any of the slash issues below
+                if _TAG_RE.match(tag):
+                    continue
+                issues.append(f"Invalid tag format in '{name}': {tag}")
                 
                 # Check for common issues
                 if tag.endswith('/'):
@@ -173,8 +250,7 @@ class TagManager:
     def display_tree_hierarchy(self) -> str:
         """Display tags in a tree format with ASCII art"""
         try:
-            with open(self.resources_file, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+            data = self._load_data()
         except Exception as e:
             return f"Error loading resources: {e}"
         
@@ -183,84 +259,97 @@ class TagManager:
         
         for resource in data.get('resources', []):
             for tag in resource.get('tags', []):
-                parts = tag.split('/')
-                if len(parts) >= 1:
-                    level1 = parts[0].strip()
-                    level2 = parts[1].strip() if len(parts) >= 2 else None
-                    level3 = parts[2].strip() if len(parts) >= 3 else None
-                    
-                    if level2:
-                        if level3:
-                            hierarchy[level1][level2].add(level3)
-                        else:
-                            # Mark that level2 exists as a direct tag
-                            hierarchy[level1][level2].add('_direct')
+                level1, level2, level3 = _split_tag(tag)
+                level1 = level1.strip()
+                level2 = level2.strip()
+                level3 = level3.strip()
+                
+                if level2:
+                    if level3:
+                        hierarchy[level1][level2].add(level3)
                     else:
-                        # Mark that level1 exists as a direct tag
-                        hierarchy[level1]['_direct'].add('_direct')
+                        # Mark that level2 exists as a direct tag
+                        hierarchy[level1][level2].add('_direct')
+                else:
+                    # Mark that level1 exists as a direct tag
+                    hierarchy[level1]['_direct'].add('_direct')
         
         # Convert to tree display
         output = []
         
-        def add_tree_line(text, depth=0, is_last=False, parent_is_last=None):
-            if depth == 0:
-                output.append(text)
-            else:
-                prefix = ""
-                if parent_is_last is not None:
-                    for i in range(depth - 1):
-                        if i < len(parent_is_last) and parent_is_last[i]:
-                            prefix += "    "
-                        else:
-                            prefix += "│   "
-                
-                if is_last:
-                    prefix += "└── "
-                else:
-                    prefix += "├── "
-                
-                output.append(prefix + text)
+        # Indent under an ancestor that is / is not the last child, and the
+        # connector in front of the node itself
+        indents = ('│   ', '    ')
+        connectors = ('├── ', '└── ')
         
-        # Sort top-level categories
-        sorted_level1 = sorted(hierarchy.keys())
+        def add_tree_line(text, parent_is_last=()):
+            # parent_is_last: one flag per level below the root, ending with this node's
+            if parent_is_last:
+                prefix = ''.join([indents[last] for last in parent_is_last[:-1]])
+                text = prefix + connectors[parent_is_last[-1]] + text
+            output.append(text)
         
-        for i, level1 in enumerate(sorted_level1):
-            is_last_level1 = (i == len(sorted_level1) - 1)
-            add_tree_line(level1, 0)
+        for level1 in sorted(hierarchy):
+            add_tree_line(level1)
             
             level2_data = hierarchy[level1]
-            sorted_level2 = sorted([k for k in level2_data.keys() if k != '_direct'])
+            sorted_level2 = sorted([k for k in level2_data if k != '_direct'])
             
             for j, level2 in enumerate(sorted_level2):
                 is_last_level2 = (j == len(sorted_level2) - 1)
-                add_tree_line(level2, 1, is_last_level2, [is_last_level1])
+                add_tree_line(level2, (is_last_level2,))
                 
                 level3_items = sorted([item for item in level2_data[level2] if item != '_direct'])
                 
                 for k, level3 in enumerate(level3_items):
-                    is_last_level3 = (k == len(level3_items) - 1) and is_last_level2
-                    add_tree_line(level3, 2, is_last_level3, [is_last_level1, is_last_level2])
+                    add_tree_line(level3, (is_last_level2, k == len(level3_items) - 1))
         
         return '\n'.join(output)
 
-    def export_tags(self, format_type: str = 'json') -> str:
-        """Export tags in various formats"""
-        analysis = self.analyze_tags()
+    def export_tags(self, format_type: str = 'json', stream: Optional[TextIO] = None) -> Optional[str]:
+        """Export tags in various formats
         
-        if format_type == 'json':
-            return json.dumps(analysis, indent=2, ensure_ascii=False)
-        elif format_type == 'csv':
+        With a stream, CSV/JSON output is written to it directly and None is
+        returned; otherwise the export is returned as a string.
+        """
+        if format_type == 'csv':
+            # Only tag counts are exported; skip the rest of the analysis
+            try:
+                tag_usage = self._collect_counters(include_combinations=False)[0]
+            except Exception as e:
+                return f"Error loading resources: {e}"
+            
             import csv
             import io
-            output = io.StringIO()
+            output = stream if stream is not None else io.StringIO()
             writer = csv.writer(output)
             writer.writerow(['Tag', 'Usage Count', 'Category'])
             
-            for tag, count in analysis['tag_usage'].items():
-                category = tag.split('/')[0] if '/' in tag else 'misc'
+            for tag, count in tag_usage.most_common():
+                category = _split_tag(tag)[0] if '/' in tag else 'misc'
                 writer.writerow([tag, count, category])
             
-            return output.getvalue()
+            return None if stream is not None else output.getvalue()
+        
+        analysis = self.analyze_tags()
+        if format_type == 'json':
+            # Export the usage counts most used first; the top lists repeat them
+            for key in ('tag_usage', 'category_usage'):
+                if key in analysis:
+                    analysis[key] = dict(analysis[key].most_common())
+            analysis.pop('top_tags', None)
+            analysis.pop('top_categories', None)
+            # Tag combinations are keyed by tuples, which JSON cannot hold
+            if 'common_combinations' in analysis:
+                analysis['common_combinations'] = {
+                    ' + '.join(combo): count
+                    for combo, count in analysis['common_combinations'].items()
+                }
+            if stream is None:
+                return json.dumps(analysis, indent=2, ensure_ascii=False)
+            json.dump(analysis, stream, indent=2, ensure_ascii=False)
+            stream.write('\n')
+            return None
         else:
             return str(analysis)
 
@@ -275,63 +364,74 @@ def main():
     parser.add_argument('--hierarchy', action='store_true', help='Show tag hierarchy')
     parser.add_argument('--tree', action='store_true', help='Display tags in tree format')
     parser.add_argument('--validate', action='store_true', help='Validate tag formats')
+    parser.add_argument('--all', action='store_true', help='Analyze, validate and suggest improvements')
     parser.add_argument('--export', choices=['json', 'csv'], help='Export tag data')
     parser.add_argument('--resources-file', type=Path, help='Path to resources.yml file')
     
     args = parser.parse_args()
+    if args.all:
+        args.analyze = args.validate = args.suggest = True
     
+    if not (args.analyze or args.validate or args.suggest or args.hierarchy
+            or args.tree or args.export):
+        parser.print_help()
+        return
+    
+    # Actions can be combined; they all share the manager's cached parse
     manager = TagManager(args.resources_file)
+    sections = 0
+    
+    def print_header(title: str):
+        nonlocal sections
+        if sections:
+            print()
+        sections += 1
+        print(title)
+        print("=" * 50)
     
     if args.analyze:
         analysis = manager.analyze_tags()
-        print("📊 TAG ANALYSIS")
-        print("=" * 50)
+        print_header("📊 TAG ANALYSIS")
         print(f"Total resources: {analysis['total_resources']}")
         print(f"Unique tags: {analysis['total_unique_tags']}")
         print(f"Resources without tags: {analysis['resources_without_tags']}")
         print(f"\n🏆 Top categories:")
-        for category, count in list(analysis['category_usage'].items())[:10]:
+        for category, count in analysis['top_categories']:
             print(f"   {category}: {count}")
         print(f"\n🏷️  Most used tags:")
-        for tag, count in list(analysis['tag_usage'].items())[:15]:
+        for tag, count in analysis['top_tags']:
             print(f"   {tag}: {count}")
     
-    elif args.suggest:
+    if args.validate:
+        issues = manager.validate_tag_format()
+        print_header("✅ TAG VALIDATION")
+        if issues:
+            print(f"Found {len(issues)} issues:")
+            for issue in issues:
+                print(f"❌ {issue}")
+        else:
+            print("✅ All tags are valid!")
+    
+    if args.suggest:
         suggestions = manager.suggest_tag_improvements()
-        print("💡 TAG IMPROVEMENT SUGGESTIONS")
-        print("=" * 50)
+        print_header("💡 TAG IMPROVEMENT SUGGESTIONS")
         for suggestion in suggestions:
             print(suggestion)
     
-    elif args.hierarchy:
+    if args.hierarchy:
         hierarchy = manager.get_tag_hierarchy()
-        print("🌳 TAG HIERARCHY")
-        print("=" * 50)
+        print_header("🌳 TAG HIERARCHY")
         print(json.dumps(hierarchy, indent=2, ensure_ascii=False))
     
-    elif args.tree:
+    if args.tree:
         tree_display = manager.display_tree_hierarchy()
-        print("🌳 TAG TREE")
-        print("=" * 50)
+        print_header("🌳 TAG TREE")
         print(tree_display)
     
-    elif args.validate:
-        issues = manager.validate_tag_format()
-        print("✅ TAG VALIDATION")
-        print("=" * 50)
-        if issues:
-            print(f"Found {len(issues)} issues:")
-            for issue in issues:
-                print(f"❌ {issue}")
-        else:
-            print("✅ All tags are valid!")
-    
-    elif args.export:
-        data = manager.export_tags(args.export)
-        print(data)
-    
-    else:
-        parser.print_help()
+    if args.export:
+        data = manager.export_tags(args.export, stream=sys.stdout)
+        if data is not None:
+            print(data)
 
 
 if __name__ == '__main__':
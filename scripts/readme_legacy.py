@@ -0,0 +1,573 @@
+#!/usr/bin/env python3
+"""
+AI Resources README Generator - full renderers
+
+Markdown/HTML renderers for the complete categorized resource list, with
+badges, styles and script. generate_readme.py imports this module only
+when run with --full, so the default README run skips loading it.
+"""
+
+import re
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple, Any
+from generate_readme import _category_order
+
+# Characters dropped from category anchors
+_ANCHOR_RE = re.compile(r"[^\w\-]")
+
+# Sort key for resources within a category (set by build_nested_dict)
+_SORT_KEY_GETTER = itemgetter("_sort_key")
+
+# Emoji per lowercased category name; the renderers look up node['_key_lc'] here
+_ICONS = {
+    'tools': '🛠️',
+    'libraries': '📚',
+    'papers': '📄', 
+    'datasets': '📊',
+    'tutorials': '🎓',
+    'community': '👥',
+    'web-resources': '🌐',
+    'frameworks': '🏗️',
+    'models': '🤖',
+    'apis': '🔌'
+}
+
+
+def get_category_icon(category: str) -> str:
+    """Get an emoji icon for a category.
+    
+    Args:
+        category: Category name (any case)
+        
+    Returns:
+        Emoji icon
+    """
+    return _ICONS.get(category.lower(), '📁')
+
+
+def _github_badges(url: str, path: str, badges: Dict[str, Tuple[str, str, Optional[str]]]) -> None:
+    """Add stars/last-commit badges for a github.com/<owner>/<repo> URL."""
+    owner, _, tail = path.partition('/')
+    # The repo name stops at the next '/' or '.' (drops any '.git')
+    repo = tail.partition('/')[0].partition('.')[0]
+    if owner and repo:
+        stars_url = f'https://img.shields.io/github/stars/{owner}/{repo}?style=flat-square&logo=github&logoColor=white'
+        commit_url = f'https://img.shields.io/github/last-commit/{owner}/{repo}?style=flat-square&logo=github&logoColor=white' 
+        
+        badges.setdefault(stars_url, ('GitHub Stars', stars_url, url))
+        badges.setdefault(commit_url, ('Last Commit', commit_url, f'{url}/commits'))
+
+
+def _arxiv_badges(url: str, path: str, badges: Dict[str, Tuple[str, str, Optional[str]]]) -> None:
+    """Add a paper badge for an arxiv.org/abs/<id> URL."""
+    if not path.startswith('abs/'):
+        return
+    rest = path[len('abs/'):]
+    if rest.strip():
+        paper_id = rest.split(None, 1)[0]
+        arxiv_badge = f'https://img.shields.io/badge/arXiv-{paper_id}-b31b1b?style=flat-square&logo=arxiv&logoColor=white'
+        badges.setdefault(arxiv_badge, ('arXiv Paper', arxiv_badge, url))
+
+
+# Badge builders keyed by URL origin ("https://host/"), most frequent hosts first
+_HOST_DISPATCH = {
+    'https://github.com/': _github_badges,
+    'https://arxiv.org/': _arxiv_badges,
+}
+
+
+def _collect_badges(url: str, item: Dict[str, Any] = None) -> List[Tuple[str, str, Optional[str]]]:
+    """Collect GitHub/ArXiv and resource-type badges for a resource.
+    
+    Args:
+        url: Resource URL
+        item: Resource item dictionary for additional context
+        
+    Returns:
+        List of (alt text, badge image URL, link URL or None) tuples
+    """
+    badges = {}  # keyed by badge image URL to drop duplicates
+    
+    # Host badges (GitHub, ArXiv): one dict lookup on the URL origin
+    origin_end = url.find('/', url.find('://') + 3)
+    if origin_end != -1:
+        handler = _HOST_DISPATCH.get(url[:origin_end + 1])
+        if handler:
+            handler(url, url[origin_end + 1:], badges)
+    
+    # Add custom badges based on resource type
+    if item:
+        tags = item.get('tags', [])
+        if any('tutorial' in tag.lower() for tag in tags):
+            tutorial_badge = 'https://img.shields.io/badge/Type-Tutorial-28a745?style=flat-square&logo=book'
+            badges.setdefault(tutorial_badge, ('Tutorial', tutorial_badge, None))
+        elif any('tool' in tag.lower() for tag in tags):
+            tool_badge = 'https://img.shields.io/badge/Type-Tool-17a2b8?style=flat-square&logo=tools'
+            badges.setdefault(tool_badge, ('Tool', tool_badge, None))
+    
+    return list(badges.values())
+
+
+def _item_badges(item: Dict[str, Any]) -> List[Tuple[str, str, Optional[str]]]:
+    """Badges for a resource, collected on first use and kept on the item.
+    
+    Resources with several tags appear under several categories; this keeps
+    them from being rebuilt for every appearance.
+    """
+    badges = item.get('_badges')
+    if badges is None:
+        badges = item['_badges'] = _collect_badges(item['_url'], item)
+    return badges
+
+
+def badges_to_html(badges: List[Tuple[str, str, Optional[str]]]) -> str:
+    """Format collected badges as HTML images, linked when they have a link URL."""
+    return ' '.join(
+        f'<a href="{link}" target="_blank" rel="noopener noreferrer"><img src="{src}" alt="{alt}"/></a>'
+        if link else f'<img src="{src}" alt="{alt}"/>'
+        for alt, src, link in badges
+    )
+
+
+def badges_to_md(badges: List[Tuple[str, str, Optional[str]]]) -> str:
+    """Format collected badges as markdown images."""
+    return ' '.join(f'![{alt}]({src})' for alt, src, _ in badges)
+
+
+def get_badges_html(url: str, item: Dict[str, Any] = None) -> str:
+    """Generate GitHub/ArXiv badges with enhanced styling.
+    
+    Args:
+        url: Resource URL
+        item: Resource item dictionary for additional context
+        
+    Returns:
+        HTML string with badges
+    """
+    return badges_to_html(_collect_badges(url, item))
+
+
+def gen_resources_markdown(nested: Dict[str, Any], depth: int = 0) -> str:
+    """Generate GitHub-compatible markdown for resources.
+    
+    Args:
+        nested: Nested dictionary of categorized resources
+        depth: Current nesting depth for styling
+        
+    Returns:
+        Markdown string with categorized resources
+    """
+    if not nested or depth > 3:
+        return ''
+        
+    markdown = []
+    # Pre-order walk with an explicit stack of (category, node, depth)
+    stack = [(cat, nested[cat], depth) for cat in reversed(_category_order(nested))]
+    while stack:
+        cat, node, depth = stack.pop()
+            
+        title = cat.replace('-', ' ').title()
+        total = node['_count']
+        
+        if total == 0:
+            continue
+            
+        # Create category header with icon and count
+        icon = _ICONS.get(node['_key_lc'], '📁')
+        header_level = '#' * (depth + 3)  # Start at h3
+        
+        markdown.append(f'\n{header_level} {icon} {title} ({total})\n')
+        
+        # Add items if they exist
+        if node.get('_items'):
+            # Sort items by name/title
+            items = sorted(node['_items'], key=_SORT_KEY_GETTER)
+            
+            for item in items:
+                name = item['_name']
+                url = item['_url']
+                desc = item['_desc']
+                badges = item.get('_badges_md')
+                if badges is None:
+                    badges = item['_badges_md'] = badges_to_md(_item_badges(item))
+                
+                # Create markdown list item
+                markdown.append(f'- **[{name}]({url})** - {desc}')
+                
+                # Add badges if they exist  
+                if badges:
+                    markdown.append(f'  {badges}')
+                
+        # Subcategories come next (pushed reversed so they pop in order)
+        if depth < 3:
+            stack.extend((sub, node[sub], depth + 1) for sub in reversed(_category_order(node)))
+    
+    return '\n'.join(markdown)
+
+
+def gen_resources_html(nested: Dict[str, Any], depth: int = 0) -> str:
+    """Generate HTML list of resources with enhanced styled cards.
+    
+    Args:
+        nested: Nested dictionary of categorized resources
+        depth: Current nesting depth for styling
+        
+    Returns:
+        HTML string with categorized resources
+    """
+    if not nested or depth > 3:
+        return ''
+        
+    html = []
+    # Pre-order walk with an explicit stack of (category, node, depth);
+    # None entries close the <details> of a category after its subcategories
+    stack = [(cat, nested[cat], depth) for cat in reversed(_category_order(nested))]
+    while stack:
+        entry = stack.pop()
+        if entry is None:
+            html.append('</details>')
+            continue
+        cat, node, depth = entry
+            
+        title = cat.replace('-', ' ').title()
+        anchor = _ANCHOR_RE.sub('', title.lower().replace(' ', '-'))
+        total = node['_count']
+        
+        if total == 0:
+            continue
+            
+        # Create category header with improved styling
+        category_class = f"category depth-{depth}"
+        icon = _ICONS.get(node['_key_lc'], '📁')
+        
+        html.append(f'<details class="{category_class}" id="{anchor}">')
+        html.append(
+            f'  <summary class="category-summary">'
+            f'<span class="category-icon">{icon}</span>'
+            f'<span class="category-title">{title}</span> '
+            f'<span class="category-count">({total})</span>'
+            f'</summary>'
+        )
+        
+        # Add items if they exist
+        if node.get('_items'):
+            html.append('  <ul class="items-list">')
+            
+            # Sort items by name/title
+            items = sorted(node['_items'], key=_SORT_KEY_GETTER)
+            
+            for item in items:
+                name = item['_name']
+                url = item['_url']
+                desc = item['_desc_short']  # truncated to 150 characters
+                badges = item.get('_badges_html')
+                if badges is None:
+                    badges = item['_badges_html'] = badges_to_html(_item_badges(item))
+                
+                html.append(
+                    f'    <li class="resource-item">'
+                    f'<div class="resource-content">'
+                    f'<h4 class="resource-name"><a href="{url}" target="_blank" rel="noopener noreferrer">{name}</a></h4>'
+                    f'<p class="resource-description">{desc}</p>'
+                    f'<div class="resource-badges">{badges}</div>'
+                    f'</div>'
+                    f'</li>'
+                )
+                
+            html.append('  </ul>')
+        
+        # Subcategories come next (pushed reversed so they pop in order)
+        stack.append(None)
+        if depth < 3:
+            stack.extend((sub, node[sub], depth + 1) for sub in reversed(_category_order(node)))
+    
+    return '\n'.join(html)
+
+
+def get_modern_styles() -> str:
+    """Generate modern CSS styles for the README.
+    
+    Returns:
+        CSS styles as a string
+    """
+    return '''
+<style>
+:root {
+  --primary-color: #2563eb;
+  --secondary-color: #64748b;
+  --success-color: #059669;
+  --warning-color: #d97706;
+  --error-color: #dc2626;
+  --bg-primary: #ffffff;
+  --bg-secondary: #f8fafc;
+  --bg-card: #f1f5f9;
+  --text-primary: #0f172a;
+  --text-secondary: #475569;
+  --border-color: #e2e8f0;
+  --shadow-sm: 0 1px 2px 0 rgb(0 0 0 / 0.05);
+  --shadow-md: 0 4px 6px -1px rgb(0 0 0 / 0.1);
+  --radius: 8px;
+}
+
+* { box-sizing: border-box; }
+
+body {
+  font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', sans-serif;
+  line-height: 1.6;
+  color: var(--text-primary);
+  background: var(--bg-primary);
+}
+
+/* Summary badges removed */
+
+/* Search */
+#resource-search {
+  width: 100%;
+  max-width: 600px;
+  padding: 1rem 1.5rem;
+  margin: 2rem auto;
+  display: block;
+  font-size: 1.1rem;
+  border: 2px solid var(--border-color);
+  border-radius: var(--radius);
+  background: var(--bg-secondary);
+  transition: all 0.3s ease;
+}
+
+#resource-search:focus {
+  outline: none;
+  border-color: var(--primary-color);
+  box-shadow: 0 0 0 3px rgba(37, 99, 235, 0.1);
+  background: var(--bg-primary);
+}
+
+/* Simplified navigation - no TOC */
+
+/* Categories Grid */
+.categories-grid {
+  display: grid;
+  grid-template-columns: repeat(auto-fit, minmax(350px, 1fr));
+  gap: 1.5rem;
+  margin: 2rem 0;
+}
+
+.category {
+  background: var(--bg-secondary);
+  border: 1px solid var(--border-color);
+  border-radius: var(--radius);
+  box-shadow: var(--shadow-sm);
+  overflow: hidden;
+  transition: all 0.3s ease;
+}
+
+.category:hover {
+  box-shadow: var(--shadow-md);
+  transform: translateY(-2px);
+}
+
+.category-summary {
+  padding: 1rem 1.5rem;
+  cursor: pointer;
+  display: flex;
+  align-items: center;
+  justify-content: space-between;
+  background: linear-gradient(135deg, var(--primary-color) 0%, #3b82f6 100%);
+  color: white;
+  font-weight: 600;
+  font-size: 1.1rem;
+  transition: background 0.3s ease;
+  user-select: none;
+}
+
+.category[open] .category-summary {
+  background: linear-gradient(135deg, var(--success-color) 0%, #10b981 100%);
+}
+
+.category-icon {
+  font-size: 1.25rem;
+  margin-right: 0.75rem;
+}
+
+.category-count {
+  background: rgba(255, 255, 255, 0.2);
+  padding: 0.25rem 0.75rem;
+  border-radius: 20px;
+  font-size: 0.875rem;
+  font-weight: 500;
+}
+
+/* Items List */
+.items-list {
+  list-style: none;
+  padding: 0;
+  margin: 0;
+}
+
+.resource-item {
+  padding: 1rem 1.5rem;
+  border-bottom: 1px solid var(--border-color);
+  transition: background-color 0.2s ease;
+}
+
+.resource-item:hover {
+  background: var(--bg-card);
+}
+
+.resource-item:last-child {
+  border-bottom: none;
+}
+
+.resource-content {
+  display: flex;
+  flex-direction: column;
+  gap: 0.5rem;
+}
+
+.resource-name {
+  margin: 0;
+  font-size: 1rem;
+  font-weight: 600;
+}
+
+.resource-name a {
+  color: var(--text-primary);
+  text-decoration: none;
+  transition: color 0.2s ease;
+}
+
+.resource-name a:hover {
+  color: var(--primary-color);
+  text-decoration: underline;
+}
+
+.resource-description {
+  margin: 0;
+  color: var(--text-secondary);
+  font-size: 0.9rem;
+  line-height: 1.5;
+}
+
+.resource-badges {
+  display: flex;
+  flex-wrap: wrap;
+  gap: 0.25rem;
+  align-items: center;
+}
+
+.resource-badges img {
+  height: 20px;
+  transition: opacity 0.2s ease;
+}
+
+.resource-badges img:hover {
+  opacity: 0.8;
+}
+
+/* Responsive Design */
+@media (max-width: 768px) {
+  .categories-grid {
+    grid-template-columns: 1fr;
+  }
+  
+  .category-summary {
+    font-size: 1rem;
+    padding: 0.875rem 1rem;
+  }
+  
+  .resource-item {
+    padding: 0.875rem 1rem;
+  }
+}
+
+/* Dark mode support */
+@media (prefers-color-scheme: dark) {
+  :root {
+    --bg-primary: #0f172a;
+    --bg-secondary: #1e293b;
+    --bg-card: #334155;
+    --text-primary: #f1f5f9;
+    --text-secondary: #cbd5e1;
+    --border-color: #475569;
+  }
+}
+</style>
+'''
+
+
+def get_enhanced_script() -> str:
+    """Generate enhanced JavaScript for search and interactions.
+    
+    Returns:
+        JavaScript code as a string
+    """
+    return '''
+<script>
+(function() {
+  'use strict';
+  
+  // Enhanced search functionality
+  const searchInput = document.getElementById('resource-search');
+  const categories = document.querySelectorAll('.category');
+  const resourceItems = document.querySelectorAll('.resource-item');
+  
+  if (searchInput) {
+    searchInput.addEventListener('input', function() {
+      const query = this.value.toLowerCase().trim();
+      
+      if (!query) {
+        // Show all categories and items
+        categories.forEach(cat => {
+          cat.style.display = '';
+          cat.querySelectorAll('.resource-item').forEach(item => {
+            item.style.display = '';
+          });
+        });
+        return;
+      }
+      
+      categories.forEach(category => {
+        const categoryText = category.textContent.toLowerCase();
+        const items = category.querySelectorAll('.resource-item');
+        let hasVisibleItems = false;
+        
+        items.forEach(item => {
+          const itemText = item.textContent.toLowerCase();
+          if (itemText.includes(query)) {
+            item.style.display = '';
+            hasVisibleItems = true;
+          } else {
+            item.style.display = 'none';
+          }
+        });
+        
+        // Show category if it matches or has visible items
+        if (categoryText.includes(query) || hasVisibleItems) {
+          category.style.display = '';
+        } else {
+          category.style.display = 'none';
+        }
+      });
+    });
+    
+    // Add search shortcut (Ctrl/Cmd + K)
+    document.addEventListener('keydown', function(e) {
+      if ((e.ctrlKey || e.metaKey) && e.key === 'k') {
+        e.preventDefault();
+        searchInput.focus();
+      }
+    });
+  }
+  
+  // Smooth scrolling removed - no TOC links
+  
+  // Add analytics for external links (optional)
+  document.querySelectorAll('a[target="_blank"]').forEach(link => {
+    link.addEventListener('click', function() {
+      // Analytics tracking could go here
+      console.log('External link clicked:', this.href);
+    });
+  });
+  
+})();
+</script>
+'''
@@ -3,7 +3,7 @@
 Test script to demonstrate improved URL normalization
 """
 
-from url_index import URLIndex
+from url_index import URLIndex, normalize_url
 
 def test_url_normalization():
     """Test various URL formats to ensure they normalize correctly"""
@@ -48,9 +48,11 @@ def test_url_normalization():
     print("URL Normalization Results:")
     print("-" * 50)
     
+    # Normalize each test URL once; the cached normalize_url also serves check_duplicate
+    normalized_by_url = {url: normalize_url(url) for url in test_cases}
+    
     normalized_urls = {}
-    for url in test_cases:
-        normalized = ui._normalize_url(url)
+    for url, normalized in normalized_by_url.items():
         if normalized not in normalized_urls:
             normalized_urls[normalized] = []
         normalized_urls[normalized].append(url)
@@ -5,10 +5,115 @@ Maintains a fast lookup index of URLs for duplicate detection
 """
 
 import json
-import yaml
+import bisect
+import functools
+import re
+from collections import Counter
+from itertools import chain
 from pathlib import Path
-from typing import Dict, Set, List, Optional
-from urllib.parse import urlparse, urlunparse
+from typing import Dict, Set, List, Optional, Iterable, Tuple
+from urllib.parse import urlparse
+
+# URLs already in normalized form: https, lowercase host without www.,
+# no trailing slash (unless root), no ';params', non-empty query if any,
+# no fragment
+_CANONICAL_RE = re.compile(
+    r'https://(?!www\.)[a-z0-9.\-]+(?::[0-9]+)?(?:/|/[^\s?#;]*[^\s?#;/])(?:\?[^\s#]+)?\Z'
+)
+
+# Plain host[:port][/path][?query][#fragment] URLs with an optional scheme
+# and www.; normalize_url rebuilds these straight from the match groups.
+# Paths with ';' are left to urlparse, which splits off the last segment's params.
+_SIMPLE_RE = re.compile(
+    r'(?:https?://)?(?:www\.)?([a-z0-9.\-]+(?::[0-9]+)?)(/[^\s?#;]*)?(?:\?([^\s#]*))?(?:#\S*)?\Z',
+    re.IGNORECASE | re.ASCII
+)
+
+# Scheme and/or www. prefix users might type, stripped before re-parsing
+_PREFIX_RE = re.compile(r'^(?:https?://)?(?:www\.)?', re.IGNORECASE | re.ASCII)
+
+# Bound once: normalize_url runs these per call, and each of these calls into C
+_match_canonical = _CANONICAL_RE.match
+_match_simple = _SIMPLE_RE.match
+_strip_prefix = _PREFIX_RE.sub
+
+
+@functools.lru_cache(maxsize=4096)
+def normalize_url(url: str) -> str:
+    """Normalize URL for consistent comparison
+    
+    Memoized: the same URLs are normalized again by every duplicate check
+    and index rebuild, and the result depends on the string alone.
+    
+    Standard library only, on purpose: results are the keys of the committed
+    url_index.json, so they must not change with optional packages (a WHATWG
+    parser would e.g. punycode and percent-encode hosts differently).
+    """
+    if not url:
+        return ""
+    
+    # Clean up the URL first
+    url = url.strip()
+    
+    # Most stored URLs are already canonical; return them unchanged
+    if _match_canonical(url):
+        return url
+    
+    # Common variants (scheme, www., case, trailing slash, fragment) are
+    # normalized from a single match, with no parsing or intermediate strings
+    m = _match_simple(url)
+    if m:
+        host, path, query = m.groups()
+        host = host.lower()
+        if host.startswith('www.'):
+            host = host[4:]
+        # A bare 'www.' host is left to the general path below
+        if host:
+            path = (path or '').rstrip('/') or '/'
+            return f"https://{host}{path}?{query}" if query else f"https://{host}{path}"
+    
+    # Remove common prefixes that users might add (case insensitive)
+    url = _strip_prefix('', url, count=1)
+    
+    # Add https:// if no protocol specified
+    if not url.startswith(('http://', 'https://')):
+        url = 'https://' + url
+    
+    try:
+        parts = urlparse(url)
+        
+        # Handle cases where the URL might be malformed
+        if not parts.netloc and parts.path:
+            # Try to fix URLs like "github.com/user/repo" without protocol
+            url = 'https://' + parts.path
+            parts = urlparse(url)
+        
+        # Remove www. from netloc for consistent comparison
+        netloc = parts.netloc.lower()
+        if netloc.startswith('www.'):
+            netloc = netloc[4:]
+        
+        # Normalize: always https, no trailing slash (but keep the root one),
+        # no fragment
+        path = parts.path.rstrip('/') or '/'
+        if parts.params:
+            path = f"{path};{parts.params}"
+        # A leftover '//host/...' path (protocol-relative input) already
+        # carries the authority separator
+        base = f"https://{netloc}{path}" if netloc or path[:2] != '//' else f"https:{path}"
+        if parts.query:
+            return f"{base}?{parts.query}"
+        return base
+    except Exception:
+        return url.lower().strip()
+
+
+def _entry_domain(info: Dict) -> Optional[str]:
+    """Lowercased host of an index entry's original URL, None if it cannot be parsed"""
+    try:
+        return urlparse(info['original_url']).netloc.lower()
+    except Exception:
+        return None
 
 
 class URLIndex:
@@ -16,12 +121,31 @@ class URLIndex:
     
     def __init__(self, index_file: Path = None):
         self.index_file = index_file or Path(__file__).parent / 'url_index.json'
-        self.index = self._load_index()
+        # Indexed URLs alone, one per line, for lookups that need no metadata
+        self._keys_file = self.index_file.with_suffix('.keys')
+        self._keys: Optional[Set[str]] = None
+        # (lengths, [(length, position, url)]) sorted by length, see _urls_by_length
+        self._by_length = None
+        # (domain counts, tag counts) over the index, see _stat_counts
+        self._stats: Optional[Tuple[Counter, Counter]] = None
+    
+    @functools.cached_property
+    def index(self) -> Dict[str, Dict]:
+        """Normalized URL -> resource info, loaded on first access"""
+        return self._load_index()
     
     def _load_index(self) -> Dict[str, Dict]:
         """Load existing URL index or create empty one"""
+        try:
+            import orjson
+        except ImportError:
+            orjson = None
         try:
             if self.index_file.exists():
+                # orjson (if installed) decodes the raw bytes directly;
+                # orjson.JSONDecodeError subclasses json.JSONDecodeError
+                if orjson is not None:
+                    return orjson.loads(self.index_file.read_bytes())
                 with open(self.index_file, 'r', encoding='utf-8') as f:
                     return json.load(f)
         except (json.JSONDecodeError, IOError) as e:
@@ -31,109 +155,163 @@ class URLIndex:
     
     def _save_index(self):
         """Save URL index to file"""
+        # Kept indented: url_index.json is committed along with resources.yml.
+        # orjson, when installed, writes the same bytes much faster.
         try:
-            with open(self.index_file, 'w', encoding='utf-8') as f:
-                json.dump(self.index, f, indent=2, ensure_ascii=False)
+            import orjson
+        except ImportError:
+            orjson = None
+        try:
+            if orjson is not None:
+                text = orjson.dumps(self.index, option=orjson.OPT_INDENT_2)
+            else:
+                text = json.dumps(self.index, indent=2, ensure_ascii=False).encode('utf-8')
+            # One write of the whole document instead of one per JSON token
+            with open(self.index_file, 'wb') as f:
+                f.write(text)
         except IOError as e:
             print(f"Error saving URL index: {e}")
+            return
+        self._save_keys()
     
-    def _normalize_url(self, url: str) -> str:
-        """Normalize URL for consistent comparison"""
-        if not url:
-            return ""
-        
-        # Clean up the URL first
-        url = url.strip()
-        
-        # Remove common prefixes that users might add (case insensitive)
-        prefixes_to_remove = ['www.', 'http://www.', 'https://www.', 'http://', 'https://']
-        url_lower = url.lower()
-        for prefix in prefixes_to_remove:
-            if url_lower.startswith(prefix):
-                url = url[len(prefix):]
-                break
+    def _index_stamp(self) -> Optional[str]:
+        """'mtime_ns size' of the index file, or None if it does not exist"""
+        try:
+            st = self.index_file.stat()
+        except OSError:
+            return None
+        return f"{st.st_mtime_ns} {st.st_size}"
+    
+    def _save_keys(self):
+        """Write the keys file for the current index file (best effort)"""
+        stamp = self._index_stamp()
+        text = '\n'.join(self.index)
+        # A key with a line break could not be read back; skip the file then
+        if stamp is None or text.count('\n') != max(len(self.index) - 1, 0):
+            return
+        try:
+            with open(self._keys_file, 'w', encoding='utf-8') as f:
+                f.write(stamp + '\n' + text)
+        except OSError:
+            pass
+    
+    def _load_keys(self) -> Optional[Set[str]]:
+        """Indexed URLs from the keys file, or None if it is missing or stale"""
+        stamp = self._index_stamp()
+        if stamp is None:
+            return None
+        try:
+            with open(self._keys_file, 'r', encoding='utf-8') as f:
+                text = f.read()
+        except OSError:
+            return None
         
-        # Add https:// if no protocol specified
-        if not url.startswith(('http://', 'https://')):
-            url = 'https://' + url
+        head, _, body = text.partition('\n')
+        if head != stamp:
+            return None
+        return set(body.split('\n')) if body else set()
+    
+    def _url_keys(self):
+        """Something supporting 'normalized_url in ...' for every indexed URL
         
-        try:
-            parsed = urlparse(url)
-            
-            # Handle cases where the URL might be malformed
-            if not parsed.netloc and parsed.path:
-                # Try to fix URLs like "github.com/user/repo" without protocol
-                url = 'https://' + parsed.path
-                parsed = urlparse(url)
-            
-            # Remove www. from netloc for consistent comparison
-            netloc = parsed.netloc.lower()
-            if netloc.startswith('www.'):
-                netloc = netloc[4:]
-            
-            # Normalize: remove trailing slash, convert to lowercase, remove www
-            normalized = urlunparse((
-                'https',  # Always use https for normalization
-                netloc,
-                parsed.path.rstrip('/') or '/',  # Keep root slash
-                parsed.params,
-                parsed.query,
-                ''  # Remove fragment for comparison
-            ))
-            return normalized
-        except Exception:
-            return url.lower().strip()
+        That is the index itself once loaded. Until then it is the set from the
+        keys file, so a lookup that misses never decodes the metadata.
+        """
+        index = self.__dict__.get('index')
+        if index is not None:
+            return index
+        if self._keys is None:
+            self._keys = self._load_keys()
+            if self._keys is None:
+                # Missing or stale keys file: use the full index and refresh it
+                self._save_keys()
+                return self.index
+        return self._keys
+    
+    def _changed(self):
+        """Record a change to the index and save it"""
+        self._by_length = None
+        self._save_index()
+    
+    # Kept as a method for existing callers; the work is done (and cached) by normalize_url
+    _normalize_url = staticmethod(normalize_url)
     
     def add_url(self, url: str, name: str, tags: List[str] = None) -> bool:
         """Add URL to index. Returns True if added, False if duplicate"""
-        normalized_url = self._normalize_url(url)
+        return self.add_urls([(url, name, tags)]) == 1
+    
+    def add_urls(self, entries: Iterable[Tuple[str, str, List[str]]]) -> int:
+        """Add several (url, name, tags) entries, saving the index once.
+        Returns the number of URLs added (duplicates are skipped)"""
+        added_count = 0
+        for url, name, tags in entries:
+            added_count += self._insert(normalize_url(url), url, name, tags)
         
+        if added_count:
+            self._changed()
+        return added_count
+    
+    def _insert(self, normalized_url: str, url: str, name: str, tags: Optional[List[str]]) -> bool:
+        """Put a new entry in the index without saving. Returns False if it is already there"""
         if normalized_url in self.index:
             return False
         
-        self.index[normalized_url] = {
+        entry = self.index[normalized_url] = {
             'name': name,
             'original_url': url,
             'tags': tags or [],
             'added_date': None  # Will be set when resource is actually added
         }
-        self._save_index()
+        self._count_entry(entry, 1)
         return True
     
     def check_duplicate(self, url: str) -> Optional[Dict]:
         """Check if URL is duplicate. Returns existing resource info if found"""
-        normalized_url = self._normalize_url(url)
-        return self.index.get(normalized_url)
+        normalized_url = normalize_url(url)
+        # A set of the keys already is the cheap negative filter; once the
+        # index is loaded, a single dict probe answers both cases
+        index = self.__dict__.get('index')
+        if index is None:
+            if normalized_url not in self._url_keys():
+                return None
+            index = self.index
+        return index.get(normalized_url)
     
     def remove_url(self, url: str) -> bool:
         """Remove URL from index"""
-        normalized_url = self._normalize_url(url)
+        normalized_url = normalize_url(url)
         if normalized_url in self.index:
-            del self.index[normalized_url]
-            self._save_index()
+            self._count_entry(self.index.pop(normalized_url), -1)
+            self._changed()
             return True
         return False
     
     def rebuild_from_resources(self, resources_file: Path) -> int:
         """Rebuild index from existing resources.yml file"""
         try:
-            with open(resources_file, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+            # Imported here so lookups never load PyYAML. The parse (libyaml when
+            # available) stays cached, so generate_readme.py reads it back for free.
+            from _yaml_cache import load_yaml
+            data = load_yaml(resources_file)
         except Exception as e:
             print(f"Error loading resources file: {e}")
             return 0
         
         resources = data.get('resources', [])
         self.index = {}  # Clear existing index
+        self._stats = None
+        
+        # Tags repeat across resources; keep one string object per distinct tag
+        shared_tags: Dict[str, str] = {}
         
         added_count = 0
         for resource in resources:
             url = resource.get('url')
             name = resource.get('name') or resource.get('title', 'Unknown')
-            tags = resource.get('tags', [])
+            tags = [shared_tags.setdefault(tag, tag) for tag in resource.get('tags') or ()]
             
             if url:
-                normalized_url = self._normalize_url(url)
+                normalized_url = normalize_url(url)
                 self.index[normalized_url] = {
                     'name': name,
                     'original_url': url,
@@ -142,56 +320,105 @@ class URLIndex:
                 }
                 added_count += 1
         
-        self._save_index()
+        self._changed()
         return added_count
     
     def get_all_tags(self) -> Set[str]:
         """Get all unique tags from indexed resources"""
-        all_tags = set()
-        for resource_info in self.index.values():
-            all_tags.update(resource_info.get('tags', []))
-        return all_tags
+        return set(chain.from_iterable(info.get('tags') or () for info in self.index.values()))
+    
+    def _urls_by_length(self) -> Tuple[List[int], List[Tuple[int, int, str]]]:
+        """Indexed URLs sorted by length, with their position in the index"""
+        if self._by_length is None:
+            entries = sorted((len(u), pos, u) for pos, u in enumerate(self.index))
+            self._by_length = ([e[0] for e in entries], entries)
+        return self._by_length
     
     def search_similar_urls(self, url: str, threshold: float = 0.8) -> List[Dict]:
-        """Find URLs that might be similar (for fuzzy duplicate detection)"""
+        """Find URLs that might be similar (for fuzzy duplicate detection)
+        
+        Uses rapidfuzz when it is installed. Its ratio is LCS-based, so scores
+        can be slightly higher than difflib's for the same pair.
+        """
+        normalized_url = normalize_url(url)
+        if threshold > 1:
+            return []
+        
+        try:
+            from rapidfuzz import fuzz, process
+        except ImportError:
+            process = None
+        if process is not None:
+            matches = process.extract(normalized_url, list(self.index), scorer=fuzz.ratio,
+                                      score_cutoff=round(threshold * 100, 6), limit=None)
+            return [
+                {'url': indexed_url, 'info': self.index[indexed_url], 'similarity': score / 100}
+                for indexed_url, score, _ in matches
+            ]
+        
         from difflib import SequenceMatcher
         
-        normalized_url = self._normalize_url(url)
-        similar = []
+        # ratio() is at most 2*min(la, lb)/(la + lb), so only URLs in this
+        # length window can reach the threshold; the rest are never compared
+        lengths, entries = self._urls_by_length()
+        n = len(normalized_url)
+        if threshold > 0:
+            lo = bisect.bisect_left(lengths, n * threshold / (2 - threshold) - 1e-9)
+            hi = bisect.bisect_right(lengths, n * (2 - threshold) / threshold + 1e-9)
+        else:
+            lo, hi = 0, len(entries)
+        
+        matcher = SequenceMatcher(None, normalized_url, '')
+        found = []
+        for _, pos, indexed_url in entries[lo:hi]:
+            matcher.set_seq2(indexed_url)
+            # Cheap upper bounds first; ratio() only for the survivors
+            if (matcher.real_quick_ratio() >= threshold
+                    and matcher.quick_ratio() >= threshold):
+                similarity = matcher.ratio()
+                if similarity >= threshold:
+                    found.append((-similarity, pos, indexed_url))
         
-        for indexed_url, info in self.index.items():
-            similarity = SequenceMatcher(None, normalized_url, indexed_url).ratio()
-            if similarity >= threshold:
-                similar.append({
-                    'url': indexed_url,
-                    'info': info,
-                    'similarity': similarity
-                })
+        # Same order as before: most similar first, ties in index order
+        found.sort()
+        return [
+            {'url': indexed_url, 'info': self.index[indexed_url], 'similarity': -neg}
+            for neg, _, indexed_url in found
+        ]
+    
+    def _stat_counts(self) -> Tuple[Counter, Counter]:
+        """(domain counts, tag counts) over the index
         
-        return sorted(similar, key=lambda x: x['similarity'], reverse=True)
+        Counted once on first use, then kept current by add_urls/remove_url.
+        """
+        if self._stats is None:
+            entries = self.index.values()
+            domains = Counter(d for d in map(_entry_domain, entries) if d is not None)
+            tags = Counter(chain.from_iterable(info.get('tags') or () for info in entries))
+            self._stats = (domains, tags)
+        return self._stats
+    
+    def _count_entry(self, info: Dict, delta: int):
+        """Add (delta=1) or remove (delta=-1) an entry in the running counts"""
+        if self._stats is None:
+            return
+        domains, tags = self._stats
+        domain = _entry_domain(info)
+        keys = [(domains, domain)] if domain is not None else []
+        keys.extend((tags, tag) for tag in info.get('tags') or ())
+        for counter, key in keys:
+            counter[key] += delta
+            if counter[key] <= 0:
+                del counter[key]
     
     def get_stats(self) -> Dict:
         """Get statistics about the URL index"""
-        total_urls = len(self.index)
-        domains = {}
-        tags = set()
-        
-        for info in self.index.values():
-            # Extract domain
-            try:
-                domain = urlparse(info['original_url']).netloc.lower()
-                domains[domain] = domains.get(domain, 0) + 1
-            except:
-                pass
-            
-            # Collect tags
-            tags.update(info.get('tags', []))
-        
+        domains, tags = self._stat_counts()
         return {
-            'total_urls': total_urls,
+            'total_urls': len(self.index),
             'total_domains': len(domains),
             'total_tags': len(tags),
-            'top_domains': sorted(domains.items(), key=lambda x: x[1], reverse=True)[:10]
+            'top_domains': domains.most_common(10)
         }
 
 
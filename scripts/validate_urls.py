@@ -1,25 +1,71 @@
 import yaml
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+
+# Concurrent HEAD requests, and keep-alive connections per host to match
+MAX_WORKERS = 32
 
 def load_resources(yaml_path):
     with open(yaml_path, 'r') as f:
         return yaml.safe_load(f)
 
-def check_url(url, timeout=5):
+def make_session():
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+def check_url(url, timeout=5, session=None):
     try:
-        r = requests.head(url, allow_redirects=True, timeout=timeout)
+        r = (session or requests).head(url, allow_redirects=True, timeout=timeout)
         status = r.status_code
         return status
     except requests.RequestException:
         return None
 
+def check_urls_threaded(urls):
+    with make_session() as session, ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        return list(executor.map(lambda url: check_url(url, session=session), urls))
+
+async def check_urls_async(urls, httpx, timeout=5):
+    # One event loop; HTTP/2 (when the h2 package is there) multiplexes
+    # requests to the same host over a single connection
+    import asyncio
+    import importlib.util
+    limits = httpx.Limits(max_connections=100)
+    semaphore = asyncio.Semaphore(50)
+    async with httpx.AsyncClient(http2=importlib.util.find_spec('h2') is not None,
+                                 timeout=timeout, limits=limits) as client:
+        async def check(url):
+            if not url:
+                return None
+            async with semaphore:
+                try:
+                    r = await client.head(url, follow_redirects=True)
+                    return r.status_code
+                except (httpx.HTTPError, httpx.InvalidURL):
+                    return None
+        return await asyncio.gather(*(check(url) for url in urls))
+
+def check_urls(urls):
+    # httpx is optional; without it, a thread pool of requests does the job
+    try:
+        import httpx
+    except ImportError:
+        return check_urls_threaded(urls)
+    import asyncio
+    return asyncio.run(check_urls_async(urls, httpx))
+
 def scan_resources(resources):
     dead = []
-    intermittent = []
-    for item in resources['resources']:
+    items = resources['resources']
+    # Statuses come back in input order, so the report order is unchanged
+    statuses = check_urls([item.get('url') for item in items])
+    for item, status in zip(items, statuses):
         name = item.get('name')
         url = item.get('url')
-        status = check_url(url)
         if status is None or (status >= 400 and status < 600):
             print(f"\033[91mERROR\033[0m: {url} ({status})\n")
             dead.append({